@@ -1,12 +1,13 @@
 """histoprint - Pretty-print histograms to the terminal"""
 
-from histoprint.formatter import HistFormatter, print_hist, text_hist
+from histoprint.formatter import HistFormatter, format_hist, print_hist, text_hist
 
 from .version import version as __version__
 
 __all__ = (
     "HistFormatter",
     "__version__",
+    "format_hist",
     "print_hist",
     "text_hist",
 )
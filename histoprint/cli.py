@@ -1,18 +1,29 @@
 """Module containing the CLI programs for histoprint."""
 
+import ast
+import codecs
 import contextlib
-from io import StringIO
-from typing import Any, Dict, List, Tuple
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List
 
 import click
 import numpy as np
 
-import histoprint as hp
 from histoprint import formatter
 
 
 @click.command()
-@click.argument("infile", type=click.Path(exists=True, dir_okay=False, allow_dash=True))
+@click.argument(
+    "infiles",
+    metavar="INFILE...",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, allow_dash=True),
+)
 @click.option(
     "-b",
     "--bins",
@@ -102,43 +113,54 @@ from histoprint import formatter
     "Calculated from number of columns by default.",
 )
 @click.version_option()
-def histoprint(infile, **kwargs):
+def histoprint(infiles, **kwargs):
     """Read INFILE and print a histogram of the contained columns.
 
-    INFILE can be '-', in which case the data is read from STDIN.
+    INFILE can be '-', in which case the data is read from STDIN. When
+    several files are given, one histogram is printed for each of them,
+    titled with the file name unless a title is given.
     """
 
-    # Read file into buffer for use by implementations
-    try:
-        with click.open_file(infile, "rt") as f:
-            data = f.read(-1)
-    except UnicodeDecodeError:
-        # Probably some binary file
-        data = ""
-
-    if len(data) > 0:
-        data_handle = StringIO(data)
-        del data
-
-        # Try to interpret file as textfile
-        try:
-            data_handle.seek(0)
-            _histoprint_txt(data_handle, **kwargs)
-            return
-        except ValueError:
-            pass
+    for infile in infiles:
+        file_kwargs = dict(kwargs)
+        if len(infiles) > 1 and not file_kwargs["title"]:
+            # Tell the plots apart
+            file_kwargs["title"] = infile
+        _histoprint_file(infile, **file_kwargs)
+
+
+def _histoprint_file(infile, **kwargs):
+    """Print the histogram of a single input file."""
+
+    # Pass files on by path, so the parsers can read them directly.
+    # STDIN can only be read once, so keep it in a binary buffer.
+    if infile == "-":
+        with click.open_file(infile, "rb") as f:
+            source = BytesIO(f.read())
+    else:
+        source = infile
+
+    head = _read_head(source)
+    if _is_text(head):
+        # Try to interpret file as textfile,
+        # unless it is clearly comma separated
+        if not _is_comma_separated(head):
+            try:
+                _histoprint_txt(_rewind(source), **kwargs)
+                return
+            except ValueError:
+                pass
 
         # Try to interpret file as CSV file
         try:
-            data_handle.seek(0)
-            _histoprint_csv(data_handle, **kwargs)
-            raise SystemExit(0)
+            _histoprint_csv(_rewind(source), **kwargs)
+            return
         except ImportError:
             click.echo("Cannot try CSV file format. Pandas module not found.", err=True)
 
     # Try to interpret file as ROOT file
     try:
-        _histoprint_root(infile, **kwargs)
+        _histoprint_root(_rewind(source), **kwargs)
         return
     except ImportError:
         pass
@@ -146,65 +168,280 @@ def histoprint(infile, **kwargs):
     raise click.FileError(infile, "Could not interpret the file format")
 
 
-def _bin_edges(kwargs, data):
-    """Get the desired bin edges."""
+# Text inputs larger than this many bytes are read in chunks of rows
+_STREAM_SIZE = 2**28
+_CHUNK_ROWS = 2**16
+# Text inputs larger than this many bytes are parsed with pandas (and pyarrow)
+# if possible
+_PANDAS_SIZE = 2**26
+# Entries of large ROOT trees are read in steps of this size
+_STEP_SIZE = "100 MB"
+
+
+def _read_head(source, size=65536):
+    """Read the first bytes of the input."""
+
+    if isinstance(source, BytesIO):
+        return source.getvalue()[:size]
+    with click.open_file(source, "rb") as f:
+        return f.read(size)
+
+
+def _is_text(head):
+    """Check whether the input starts with non-empty text."""
+
+    # Ignore multi-byte characters cut off at the end
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        decoder.decode(head)
+    except UnicodeDecodeError:
+        # Probably some binary file
+        return False
+    return len(head) > 0
+
+
+def _is_comma_separated(head):
+    """Check whether the first line with data contains commas.
+
+    Such lines can not be parsed as a whitespace separated table of numbers.
+
+    """
+
+    for line in head.decode("utf-8", errors="ignore").splitlines():
+        # Ignore comments and empty lines
+        data = line.split("#")[0].strip()
+        if data:
+            return "," in data
+    return False
+
+
+def _rewind(source):
+    """Make sure buffered input is read from the start."""
+
+    if isinstance(source, BytesIO):
+        source.seek(0)
+    return source
+
+
+def _input_size(source):
+    """Get the size of the input in bytes."""
+
+    if isinstance(source, BytesIO):
+        return len(source.getbuffer())
+    return Path(source).stat().st_size
+
+
+def _chunked(read_chunks, size, chunk_size):
+    """Prepare reading the data in chunks.
+
+    Parameters
+    ----------
+
+    read_chunks : callable
+        Called with the size of the chunks, or None to read everything at
+        once. Returns an iterable over the chunks of the data.
+    size : int
+        The size of the input in bytes
+    chunk_size : int or str
+        The size of the chunks if the input is large
+
+    Returns
+    -------
+
+    chunks : callable
+        Returns an iterable over the chunks of the data each time it is
+        called. Large inputs are read again every time, so that only a
+        single chunk has to be kept in memory. Smaller inputs are only
+        read once.
+
+    """
+
+    if size > _STREAM_SIZE:
+        return lambda: read_chunks(chunk_size)
+
+    data = list(read_chunks(None))
+    return lambda: data
+
+
+def _bin_edges(kwargs, chunks):
+    """Get the desired bin edges.
+
+    The range of the data is determined from all chunks of the data.
+
+    """
     bins = kwargs.pop("bins", "10")
-    bins = np.fromiter(bins.split(), dtype=float)
+    bins = np.array(bins.split(), dtype=float)
     if len(bins) == 1:
         bins = int(bins[0])
     if isinstance(bins, int):
         minval = np.inf
         maxval = -np.inf
-        for d in data:
-            try:
-                minval = min(minval, np.nanmin(d))
-                maxval = max(maxval, np.nanmax(d))
-            except ValueError:
-                # Empty data?
-                pass
+        for chunk in chunks:
+            # Reduce all columns of a table at once,
+            # ragged columns one by one instead of copying them together
+            columns = [chunk] if isinstance(chunk, np.ndarray) else chunk
+            for data in columns:
+                if np.size(data) > 0:
+                    minval = min(minval, np.nanmin(data))
+                    maxval = max(maxval, np.nanmax(data))
         bins = np.linspace(minval, maxval, bins + 1)
     return bins
 
 
+def _read_whitespace_table(infile, chunksize=None):
+    """Read a whitespace separated table of numbers.
+
+    Uses the faster C parser of pandas for large inputs if it is available.
+    Yields the table in chunks of ``chunksize`` rows, or all at once.
+
+    """
+
+    if chunksize is None and _input_size(infile) < _PANDAS_SIZE:
+        # Importing pandas takes longer than parsing small tables with NumPy
+        yield np.loadtxt(infile, ndmin=2)
+        return
+
+    try:
+        import pandas as pd
+    except ImportError:
+        yield from _loadtxt_chunks(infile, chunksize)
+        return
+
+    options = {
+        "sep": r"\s+",
+        "header": None,
+        "comment": "#",
+        "dtype": np.float64,
+        "engine": "c",
+    }
+    if chunksize is None:
+        yield pd.read_csv(infile, **options).to_numpy()
+        return
+
+    with pd.read_csv(infile, chunksize=chunksize, **options) as reader:
+        for chunk in reader:
+            yield chunk.to_numpy()
+
+
+def _loadtxt_chunks(infile, chunksize=None):
+    """Read a whitespace separated table with NumPy, ``chunksize`` lines at a time."""
+
+    if chunksize is None:
+        yield np.loadtxt(infile, ndmin=2)
+        return
+
+    # Do not close the STDIN buffer, it is still needed by the caller
+    if isinstance(infile, BytesIO):
+        context = contextlib.nullcontext(infile)
+    else:
+        context = click.open_file(infile, "rb")
+    with context as f:
+        while True:
+            lines = list(islice(f, chunksize))
+            if not lines:
+                return
+            data = np.loadtxt(lines, ndmin=2)
+            # Skip chunks that only contain comments
+            if data.size:
+                yield data
+
+
+def _histogram(data, bins):
+    """Histogram all columns of the data with the same bin edges.
+
+    Parameters
+    ----------
+
+    data : iterable of arrays
+        The columns to histogram
+    bins : ndarray
+        The bin edges
+
+    Returns
+    -------
+
+    counts : ndarray
+        The counts of shape ``(n_columns, n_bins)``
+
+    """
+
+    counts = np.empty((len(data), len(bins) - 1), dtype=np.intp)
+
+    def fill(i):
+        # NumPy sorts the values in blocks and searches them for the bin edges,
+        # which is faster than looking up the bin of each value individually,
+        # even for equally spaced bins.
+        counts[i] = np.histogram(data[i], bins=bins)[0]
+
+    if len(data) > 1:
+        # NumPy releases the GIL while sorting and searching,
+        # so the columns can be histogrammed in parallel
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(fill, range(len(data))))
+    else:
+        for i in range(len(data)):
+            fill(i)
+    return counts
+
+
+def _histogram_chunks(chunks, bins):
+    """Histogram the data chunk by chunk, see `_histogram`."""
+
+    counts = None
+    for data in chunks:
+        if counts is None:
+            counts = _histogram(data, bins)
+        else:
+            counts += _histogram(data, bins)
+
+    # Halve the memory the printer has to go through if possible
+    if counts is not None and counts.max(initial=0) < np.iinfo(np.int32).max:
+        counts = counts.astype(np.int32)
+    return counts
+
+
 def _histoprint_txt(infile, **kwargs):
     """Interpret file as as simple whitespace separated table."""
 
-    # Read the data
-    data = np.loadtxt(infile, ndmin=2)
-    data = data.T
     cut = kwargs.pop("cut", "")
-    if cut is not None and len(cut) > 0:
-        try:
-            data = data[:, eval(cut)]
-        except Exception as e:
-            click.echo("Error interpreting the cut string:", err=True)
-            click.echo(e, err=True)
-            raise SystemExit(1) from None
-
-    # Interpret field numbers
     fields = kwargs.pop("fields", [])
-    if len(fields) > 0:
-        try:
-            fields = [int(f) for f in fields]
-        except ValueError:
-            click.echo("Fields for a TXT file must be integers.", err=True)
-            raise SystemExit(1) from None
-        try:
-            data = data[fields]
-        except KeyError:
-            click.echo("Field out of bounds.", err=True)
-            raise SystemExit(1) from None
+
+    def read_chunks(chunksize):
+        for chunk in _read_whitespace_table(_rewind(infile), chunksize):
+            data = chunk.T
+            if cut is not None and len(cut) > 0:
+                try:
+                    data = data[:, eval(cut)]
+                except Exception as e:
+                    click.echo("Error interpreting the cut string:", err=True)
+                    click.echo(e, err=True)
+                    raise SystemExit(1) from None
+
+            # Interpret field numbers
+            if len(fields) > 0:
+                try:
+                    field_numbers = [int(f) for f in fields]
+                except ValueError:
+                    click.echo("Fields for a TXT file must be integers.", err=True)
+                    raise SystemExit(1) from None
+                try:
+                    data = data[field_numbers]
+                except IndexError:
+                    click.echo("Field out of bounds.", err=True)
+                    raise SystemExit(1) from None
+            yield data
+
+    # Read the data
+    chunks = _chunked(read_chunks, _input_size(infile), _CHUNK_ROWS)
 
     # Interpret bins
-    bins = _bin_edges(kwargs, data)
+    bins = _bin_edges(kwargs, chunks())
 
     # Create the histogram(s)
-    hist: Tuple[Any, Any] = ([], bins)
-    for d in data:
-        hist[0].append(np.histogram(d, bins=bins)[0])
+    hist = (_histogram_chunks(chunks(), bins), bins)
 
     # Print the histogram
-    hp.print_hist(hist, **kwargs)
+    formatter.print_hist(hist, **kwargs)
 
 
 def _histoprint_csv(infile, **kwargs):
@@ -212,43 +449,180 @@ def _histoprint_csv(infile, **kwargs):
 
     import pandas as pd
 
-    # Read the data
-    data = pd.read_csv(infile)
     cut = kwargs.pop("cut", "")
-    if cut is not None and len(cut) > 0:
-        try:
-            data = data[data.eval(cut)]
-        except Exception as e:
-            click.echo("Error interpreting the cut string:", err=True)
-            click.echo(e, err=True)
-            raise SystemExit(1) from None
-
-    # Interpret field numbers/names
     fields = list(kwargs.pop("fields", []))
-    if len(fields) > 0:
-        try:
-            data = data[fields]
-        except KeyError:
+
+    options = {}
+    if len(fields) > 0 and not cut:
+        # Only parse the requested columns
+        columns = pd.read_csv(_rewind(infile), nrows=0).columns
+        if any(f not in columns for f in fields):
             click.echo("Unknown column name.", err=True)
             raise SystemExit(1) from None
+        options["usecols"] = list(dict.fromkeys(fields))
 
-    # Get default columns labels
-    if kwargs.get("labels", ("",)) == ("",):
-        kwargs["labels"] = data.columns
+    def read_chunks(chunksize):
+        if chunksize is not None:
+            reader = pd.read_csv(_rewind(infile), chunksize=chunksize, **options)
+        elif _input_size(infile) < _PANDAS_SIZE:
+            reader = [pd.read_csv(_rewind(infile), **options)]
+        else:
+            # The pyarrow engine parses in multiple threads,
+            # but cannot read in chunks and is slow to import
+            try:
+                reader = [pd.read_csv(_rewind(infile), engine="pyarrow", **options)]
+            except ImportError:
+                reader = [pd.read_csv(_rewind(infile), **options)]
+        for chunk in reader:
+            data = chunk
+            if cut is not None and len(cut) > 0:
+                try:
+                    data = data[data.eval(cut)]
+                except Exception as e:
+                    click.echo("Error interpreting the cut string:", err=True)
+                    click.echo(e, err=True)
+                    raise SystemExit(1) from None
+
+            # Interpret field numbers/names
+            if len(fields) > 0:
+                try:
+                    data = data[fields]
+                except KeyError:
+                    click.echo("Unknown column name.", err=True)
+                    raise SystemExit(1) from None
+
+            # Get default columns labels
+            if kwargs.get("labels", ("",)) == ("",):
+                kwargs["labels"] = list(data.columns)
+
+            # Convert to array
+            yield data.to_numpy().T
 
-    # Convert to array
-    data = data.to_numpy().T
+    # Read the data
+    chunks = _chunked(read_chunks, _input_size(infile), _CHUNK_ROWS)
 
     # Interpret bins
-    bins = _bin_edges(kwargs, data)
+    bins = _bin_edges(kwargs, chunks())
 
     # Create the histogram(s)
-    hist: Tuple[Any, Any] = ([], bins)
-    for d in data:
-        hist[0].append(np.histogram(d, bins=bins)[0])
+    hist = (_histogram_chunks(chunks(), bins), bins)
 
     # Print the histogram
-    hp.print_hist(hist, **kwargs)
+    formatter.print_hist(hist, **kwargs)
+
+
+def _parse_index(node):
+    """Turn the AST node of a subscript into an index object."""
+
+    if isinstance(node, ast.Tuple):
+        return tuple(_parse_index(elt) for elt in node.elts)
+    if sys.version_info < (3, 9):
+        # Python 3.8 wraps subscripts in extra nodes
+        if isinstance(node, ast.ExtSlice):
+            return tuple(_parse_index(dim) for dim in node.dims)
+        if isinstance(node, ast.Index):
+            return _parse_index(node.value)
+    if isinstance(node, ast.Slice):
+        return slice(
+            *(
+                None if part is None else _parse_index(part)
+                for part in (node.lower, node.upper, node.step)
+            )
+        )
+    if isinstance(node, ast.Constant) and (
+        node.value is None or node.value is Ellipsis or isinstance(node.value, int)
+    ):
+        return node.value
+    if (
+        isinstance(node, ast.UnaryOp)
+        and isinstance(node.op, ast.USub)
+        and isinstance(node.operand, ast.Constant)
+        and isinstance(node.operand.value, int)
+    ):
+        return -node.operand.value
+    msg = "Only integers, slices, 'None' and '...' are supported as indices."
+    raise ValueError(msg)
+
+
+def _parse_slices(slices):
+    """Parse slices like '[:,2]' or '[1:][0]' without `eval`.
+
+    Returns the index objects in the order they have to be applied.
+
+    """
+
+    if not slices:
+        return []
+
+    try:
+        expr = ast.parse("x" + slices, mode="eval").body
+    except SyntaxError:
+        msg = f"Could not interpret the slice: '{slices}'"
+        raise ValueError(msg) from None
+
+    # Collect the subscripts from the outermost to the innermost
+    indices = []
+    while isinstance(expr, ast.Subscript):
+        indices.append(_parse_index(expr.slice))
+        expr = expr.value
+    if not (isinstance(expr, ast.Name) and expr.id == "x"):
+        msg = f"Could not interpret the slice: '{slices}'"
+        raise ValueError(msg)
+
+    return indices[::-1]
+
+
+def _apply_slices(array, slices):
+    """Apply slices like '[:,2]' or '[1:][0]' to an array, see `_parse_slices`."""
+
+    for index in _parse_slices(slices):
+        array = array[index]
+    return array
+
+
+def _selects_entries(slices):
+    """Check whether slices might select along the first axis, the entries."""
+
+    for index in _parse_slices(slices):
+        first = index[0] if isinstance(index, tuple) and len(index) > 0 else index
+        if first != slice(None):
+            return True
+    return False
+
+
+def _read_tree(tree, paths, cut, library, step_size):
+    """Read branches of a tree, all at once or in steps of entries.
+
+    The branches are read and cut in one go, so every basket is only read
+    once. The baskets are decompressed and interpreted in parallel.
+
+    """
+
+    import uproot as up
+
+    expressions = list(dict.fromkeys(paths))
+    try:
+        with ThreadPoolExecutor() as decompression, ThreadPoolExecutor() as interp:
+            options = {
+                "cut": cut,
+                "library": library,
+                "decompression_executor": decompression,
+                "interpretation_executor": interp,
+            }
+            if step_size is None:
+                yield tree.arrays(expressions, **options)
+            else:
+                yield from tree.iterate(expressions, step_size=step_size, **options)
+    except up.KeyInFileError as e:
+        click.echo(e, err=True)
+        click.echo(f"Possible keys: {tree.keys()}", err=True)
+        raise SystemExit(1) from None
+    except Exception as e:
+        if cut is None:
+            raise
+        click.echo("Error interpreting the cut string:", err=True)
+        click.echo(e, err=True)
+        raise SystemExit(1) from None
 
 
 def _histoprint_root(infile, **kwargs):
@@ -298,19 +672,23 @@ def _histoprint_root(infile, **kwargs):
                 pass
             else:
                 kwargs.pop("bins", None)  # Get rid of useless parameter
-                hp.print_hist(hist, **kwargs)
+                formatter.print_hist(hist, **kwargs)
                 return
 
-    data = []
     # Find TTrees
     trees: List[up.models.TTree.Model_TTree_v19] = []
     tree_fields: List[List[Dict[str, Any]]] = []
+    # Objects already looked up in the file, by their path
+    objects: Dict[str, Any] = {}
     for field, label in zip(fields, labels):
         branch = F
         splitfield = field.split("/")
         for i, key in enumerate(splitfield):
+            prefix = "/".join(splitfield[: i + 1])
             try:
-                branch = branch[key]
+                if prefix not in objects:
+                    objects[prefix] = branch[key]
+                branch = objects[prefix]
             except KeyError:
                 click.echo(
                     f"Could not find key '{key}'. Possible values: {branch.keys()}",
@@ -321,10 +699,10 @@ def _histoprint_root(infile, **kwargs):
             if hasattr(branch, "arrays"):
                 # Found it
                 path = "/".join(splitfield[i + 1 :])
-                if branch in trees:
-                    tree_fields[trees.index(branch)].append(
-                        {"label": label, "path": path}
-                    )
+                for tree, tfields in zip(trees, tree_fields):
+                    if tree is branch:
+                        tfields.append({"label": label, "path": path})
+                        break
                 else:
                     trees.append(branch)
                     tree_fields.append([{"label": label, "path": path}])
@@ -333,60 +711,80 @@ def _histoprint_root(infile, **kwargs):
 
     # Reassign labels in correct order
     labels = []
-    # Get and flatten the data
+    # Branches and slices to read from each tree
+    reads = []
+    size = 0
+    read_whole = False
     for tree, fields in zip(trees, tree_fields):
-        aliases = {}
-        d = []
+        paths = []
+        slices = []
         for field in fields:
             labels.append(field["label"])
             split = field["path"].split("[")
-            path = split[0]
-            slic = "[" + "[".join(split[1:]) if len(split) > 1 else ""
-            aliases[field["label"]] = path
-            # Get the branches
-            try:
-                d.append(eval("tree[path].array()" + slic))
-            except up.KeyInFileError as e:
-                click.echo(e, err=True)
-                click.echo(f"Possible keys: {tree.keys()}", err=True)
-                raise SystemExit(1) from None
-
-        # Cut on values
-        if cut is not None:
-            try:
-                index = tree.arrays("cut", aliases={"cut": cut}).cut
-            except up.KeyInFileError as e:
-                click.echo(e, err=True)
-                click.echo(f"Possible keys: {tree.keys()}", err=True)
-                raise SystemExit(1) from None
-            except Exception as e:
-                click.echo("Error interpreting the cut string:", err=True)
-                click.echo(e, err=True)
-                raise SystemExit(1) from None
+            paths.append(split[0])
+            slices.append("[" + "[".join(split[1:]) if len(split) > 1 else "")
 
-            for i in range(len(d)):
-                d[i] = d[i][index]
+        try:
+            branches = [tree[path] for path in dict.fromkeys(paths)]
+        except up.KeyInFileError as e:
+            click.echo(e, err=True)
+            click.echo(f"Possible keys: {tree.keys()}", err=True)
+            raise SystemExit(1) from None
+        # Branches of plain numbers can be read as NumPy arrays directly
+        numerical = all(
+            isinstance(branch.interpretation, up.interpretation.numerical.Numerical)
+            for branch in branches
+        )
+        size += sum(branch.uncompressed_bytes for branch in branches)
+        reads.append((tree, paths, slices, "np" if numerical else "ak"))
 
-        # Flatten if necessary
-        for i in range(len(d)):
-            with contextlib.suppress(ValueError):
-                d[i] = ak.flatten(d[i])
+        try:
+            if any(_selects_entries(slic) for slic in slices):
+                # Selecting entries only works on the whole tree,
+                # so do not read it in steps
+                read_whole = True
+        except ValueError as e:
+            click.echo(e, err=True)
+            raise SystemExit(1) from None
 
-            # Turn into flat numpy array
-            d[i] = ak.to_numpy(d[i])
+    def flatten(array):
+        if isinstance(array, np.ndarray):
+            return np.ravel(array)
+
+        with contextlib.suppress(ValueError):
+            array = ak.flatten(array)
+
+        # Turn into flat numpy array
+        return ak.to_numpy(array)
+
+    def read_chunks(step_size):
+        # Each chunk holds all fields, those of other trees are empty
+        empty = np.empty(0)
+        n_before = 0
+        for tree, paths, slices, library in reads:
+            n_after = len(labels) - n_before - len(paths)
+            for arrays in _read_tree(tree, paths, cut, library, step_size):
+                d = []
+                for path, slic in zip(paths, slices):
+                    try:
+                        d.append(flatten(_apply_slices(arrays[path], slic)))
+                    except ValueError as e:
+                        click.echo(e, err=True)
+                        raise SystemExit(1) from None
+                yield [empty] * n_before + d + [empty] * n_after
+            n_before += len(paths)
 
-        data.extend(d)
+    # Read the data
+    chunks = _chunked(read_chunks, 0 if read_whole else size, _STEP_SIZE)
 
     # Assign new label order
     kwargs["labels"] = labels
 
     # Interpret bins
-    bins = _bin_edges(kwargs, data)
+    bins = _bin_edges(kwargs, chunks())
 
     # Create the histogram(s)
-    hist = ([], bins)
-    for d in data:
-        hist[0].append(np.histogram(d, bins=bins)[0])
+    hist = (_histogram_chunks(chunks(), bins), bins)
 
     # Print the histogram
-    hp.print_hist(hist, **kwargs)
+    formatter.print_hist(hist, **kwargs)
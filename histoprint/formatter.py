@@ -1,9 +1,10 @@
 """Module for plotting Numpy-like 1D histograms to the terminal."""
 
+import functools
 import shutil
 import sys
 from collections.abc import Sequence
-from itertools import cycle
+from itertools import chain, cycle, islice
 from typing import Optional
 
 import numpy as np
@@ -11,11 +12,12 @@ from uhi.numpy_plottable import ensure_plottable_histogram
 from uhi.typing.plottable import PlottableHistogram
 
 DEFAULT_SYMBOLS = " |=/\\"
+ALLOWED_SYMBOLS = r" =|\/"
 COMPOSING_SYMBOLS = "/\\"
 DEFAULT_FG_COLORS = "WWWWW"
 DEFAULT_BG_COLORS = "K0000"
 
-__all__ = ["HistFormatter", "print_hist", "text_hist"]
+__all__ = ["HistFormatter", "format_hist", "print_hist", "text_hist"]
 
 
 class Hixel:
@@ -31,62 +33,20 @@ class Hixel:
 
     def add(self, char=" ", fg="0", bg="0"):
         """Add another element on top."""
-
-        allowed = r" =|\/"
-        if char not in allowed:
-            msg = f"Symbol not one of the allowed: '{allowed!r}'"
-            raise ValueError(msg)
-
-        if fg == self.fg_color:
-            # Combine characters if possible
-            char_combinations = {
-                ("|", "="): "#",
-                ("=", "|"): "#",
-                ("#", "="): "#",
-                ("#", "|"): "#",
-            }
-            compose_chars = r"\/"
-            compose_combinations = {
-                ("/", "\\"): "X",
-                ("\\", "/"): "X",
-                (" ", "\\"): "\\",
-                (" ", "/"): "/",
-            }
-            if char in compose_chars:
-                if self.compose is not None:
-                    self.compose = compose_combinations.get((self.compose, char))
-            else:
-                self.character = char_combinations.get((self.character, char), char)
-        elif char != " ":
-            # Otherwise overwrite if it is not a " "
-            self.character = " "
-            self.fg_color = fg
-            self.add(char, fg, bg)
-
-        if bg != "0":
-            self.bg_color = bg
+        state = (self.character, self.compose, self.fg_color, self.bg_color)
+        state = _add_symbol(state, char, fg, bg)
+        self.character, self.compose, self.fg_color, self.bg_color = state
 
     def render(self, reset=True):
         """Render the Hixel as a string."""
-        ret = ""
-        if (
-            self.character == " "
-            and (self.compose == " " or self.compose is None)
-            and self.bg_color != "0"
-        ):
-            # Instead of printing a space with BG color,
-            # print a full block with same FG color,
-            # so the histogram can be copied to text editors.
-            # Replace BG colour with opposite brightness,
-            # so it shows when the text is selected in a terminal.
-            ret += self.ansi_color_string(self.bg_color, self.bg_color.swapcase())
-            ret += "\u2588"
-        else:
-            ret += self.ansi_color_string(self.fg_color, self.bg_color)
-            ret += self.substitute_character(self.character, self.compose)
-        if reset:
-            ret += self.ansi_color_string("0", "0")
-        return ret
+        return _render_hixel(
+            self.character,
+            self.compose,
+            self.fg_color,
+            self.bg_color,
+            self.use_color,
+            reset,
+        )
 
     @staticmethod
     def substitute_character(char, compose):
@@ -103,54 +63,172 @@ class Hixel:
 
         """
 
-        subs = {
-            "|": "\u2502",
-            "=": "\u2550",
-            "#": "\u256a",
-            "\\": "\u20e5",
-            "/": "\u20eb",
-            "X": "\u20e5\u20eb",
-            None: "",
-        }
-
-        ret = subs.get(char, char)
+        ret = _SUBSTITUTIONS.get(char, char)
         # Characters can be displayed differently when they have a composing character on top.
         # This looks ugly if some Hixels of a histogram are covered by another and some are not.
         # Unless explicitly asked for no compositio, if no composition is added,
         # use empty composition character to make them all display the same.
-        ret += subs.get(compose, "\u034f")
+        ret += _SUBSTITUTIONS.get(compose, "\u034f")
 
         return ret
 
     def ansi_color_string(self, fg, bg):
         """Set the terminal color."""
-        ret = ""
-        if self.use_color:
-            # The ANSI color codes
-            subs = {
-                "k": 30,
-                "r": 31,
-                "g": 32,
-                "y": 33,
-                "b": 34,
-                "m": 35,
-                "c": 36,
-                "w": 37,
-                "0": 39,  # Reset to default
-                "K": 90,
-                "R": 91,
-                "G": 92,
-                "Y": 93,
-                "B": 94,
-                "M": 95,
-                "C": 96,
-                "W": 97,
-            }
-            fg = subs[fg]
-            bg = subs[bg] + 10
-
-            ret += f"\033[{fg:d};{bg:d}m"
-        return ret
+        return _ansi(fg, bg, self.use_color)
+
+
+# Unicode replacements of the ASCII characters, see `Hixel.substitute_character`
+_SUBSTITUTIONS = {
+    "|": "\u2502",
+    "=": "\u2550",
+    "#": "\u256a",
+    "\\": "\u20e5",
+    "/": "\u20eb",
+    "X": "\u20e5\u20eb",
+    None: "",
+}
+
+_ALLOWED_SYMBOLS = frozenset(ALLOWED_SYMBOLS)
+_COMPOSING_SYMBOLS = frozenset(COMPOSING_SYMBOLS)
+
+# Combinations of characters drawn on top of each other
+_CHAR_COMBINATIONS = {
+    ("|", "="): "#",
+    ("=", "|"): "#",
+    ("#", "="): "#",
+    ("#", "|"): "#",
+}
+_COMPOSE_COMBINATIONS = {
+    ("/", "\\"): "X",
+    ("\\", "/"): "X",
+    (" ", "\\"): "\\",
+    (" ", "/"): "/",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _add_symbol(state, char, fg, bg):
+    """Add a symbol on top of a Hixel state.
+
+    The state is a ``(character, compose, fg_color, bg_color)`` tuple.
+    Returns the new state.
+
+    """
+
+    character, compose, fg_color, bg_color = state
+
+    if char not in _ALLOWED_SYMBOLS:
+        msg = f"Symbol not one of the allowed: '{ALLOWED_SYMBOLS!r}'"
+        raise ValueError(msg)
+
+    if fg == fg_color:
+        # Combine characters if possible
+        if char in _COMPOSING_SYMBOLS:
+            if compose is not None:
+                compose = _COMPOSE_COMBINATIONS.get((compose, char))
+        else:
+            character = _CHAR_COMBINATIONS.get((character, char), char)
+    elif char != " ":
+        # Otherwise overwrite if it is not a " "
+        return _add_symbol((" ", compose, fg, bg_color), char, fg, bg)
+
+    if bg != "0":
+        bg_color = bg
+
+    return character, compose, fg_color, bg_color
+
+
+# The ANSI color codes
+_ANSI_CODES = {
+    "k": 30,
+    "r": 31,
+    "g": 32,
+    "y": 33,
+    "b": 34,
+    "m": 35,
+    "c": 36,
+    "w": 37,
+    "0": 39,  # Reset to default
+    "K": 90,
+    "R": 91,
+    "G": 92,
+    "Y": 93,
+    "B": 94,
+    "M": 95,
+    "C": 96,
+    "W": 97,
+}
+
+# Escape sequences for all combinations of foreground and background colours
+_ANSI_ESCAPES = {
+    (fg, bg): f"\033[{fg_code:d};{bg_code + 10:d}m"
+    for fg, fg_code in _ANSI_CODES.items()
+    for bg, bg_code in _ANSI_CODES.items()
+}
+
+
+def _ansi(fg, bg, use_color):
+    """Return the ANSI escape sequence setting the given colours."""
+    return _ANSI_ESCAPES[fg, bg] if use_color else ""
+
+
+@functools.lru_cache(maxsize=512)
+def _hixel_glyph(character, compose, fg, bg):
+    """Return the colours and the text a Hixel state is drawn with.
+
+    The number of distinct Hixel states in a plot is small, so the results
+    are cached.
+
+    """
+    if character == " " and (compose == " " or compose is None) and bg != "0":
+        # Instead of printing a space with BG color,
+        # print a full block with same FG color,
+        # so the histogram can be copied to text editors.
+        # Replace BG colour with opposite brightness,
+        # so it shows when the text is selected in a terminal.
+        return bg, bg.swapcase(), "\u2588"
+    return fg, bg, Hixel.substitute_character(character, compose)
+
+
+@functools.lru_cache(maxsize=512)
+def _render_hixel(character, compose, fg, bg, use_color, reset):
+    """Render a single Hixel state as a string."""
+    fg, bg, glyph = _hixel_glyph(character, compose, fg, bg)
+    ret = _ansi(fg, bg, use_color) + glyph
+    if reset:
+        ret += _ansi("0", "0", use_color)
+    return ret
+
+
+def _render_line(runs, use_color):
+    """Render runs of Hixels as a line of text.
+
+    Parameters
+    ----------
+
+    runs : iterable of ((fg, bg, glyph), length) tuples
+        The drawn Hixels, see `_hixel_glyph`, and how often they repeat
+    use_color : bool
+        Whether to emit ANSI colour codes
+
+    Colours are only set when they differ from the previous cell and reset
+    once at the end of the line, instead of for every single cell.
+
+    """
+
+    if not use_color:
+        return "".join(glyph * n for (_, _, glyph), n in runs)
+
+    default = current = ("0", "0")
+    parts = []
+    for (fg, bg, glyph), n in runs:
+        if (fg, bg) != current:
+            current = (fg, bg)
+            parts.append(_ANSI_ESCAPES[current])
+        parts.append(glyph * n)
+    if current != default:
+        parts.append(_ANSI_ESCAPES[default])
+    return "".join(parts)
 
 
 class BinFormatter:
@@ -232,6 +310,60 @@ class BinFormatter:
         else:
             self.use_color = use_color
         self.compose: Optional[str] = None
+        self.styles: list = []
+        self._stack_cells: list = []
+        self._overlay_cells: dict = {}
+
+    def set_styles(self, n_hists):
+        """Assign symbols and colours to a number of histograms.
+
+        Also decides whether composing characters are needed for them.
+
+        """
+
+        self.styles = list(
+            islice(
+                zip(cycle(self.symbols), cycle(self.fg_colors), cycle(self.bg_colors)),
+                n_hists,
+            )
+        )
+
+        # Decide whether to use composing characters
+        if any(s in COMPOSING_SYMBOLS for s, _, _ in self.styles):
+            self.compose = " "
+        else:
+            self.compose = None
+
+        # Drawn overlay cells, keyed by the histograms covering them
+        self._overlay_cells = {}
+
+        if self.stack:
+            # Stacked histograms never overlap,
+            # so each of them always looks the same
+            self._stack_cells = [
+                _hixel_glyph(*_add_symbol((" ", self.compose, fg, bg), s, fg, bg))
+                for s, fg, bg in self.styles
+            ]
+
+    def bin_heights(self, counts, widths):
+        """Calculate the bin heights in characters.
+
+        Parameters
+        ----------
+
+        counts : ndarray
+            The counts for each histogram and bin, shape ``(n_hists, n_bins)``
+        widths : ndarray
+            The width of each bin in lines
+
+        """
+
+        # Adjust scale by width if area represents counts
+        scale = self.scale * (widths if self.count_area else np.ones_like(widths))
+        # The product is a fresh array, so it can be fixed in place
+        scale[scale == 0] = 1.0
+
+        return (counts // scale).astype(np.intp)
 
     def format_bin(self, top, bottom, counts, width=1):
         """Return a string that represents the bin.
@@ -250,73 +382,92 @@ class BinFormatter:
 
         """
 
-        # Adjust scale by width if area represents counts
-        scale = self.scale * (width if self.count_area else 1)
+        counts = np.asarray(counts, dtype=float)[:, np.newaxis]
+        heights = self.bin_heights(counts, np.array([width]))[:, 0]
+        tick = self.tick(top if self.print_top_edge else bottom)
+        return self.format_lines(tick, self.no_tick(), self.bin_line(heights), width)
 
-        if scale == 0:
-            scale = 1.0
+    def bin_line(self, heights):
+        """Render the symbols of one line of a bin.
 
-        # Calculate bin heights in characters
-        heights = [int(c // scale) for c in counts]
+        Parameters
+        ----------
 
-        # Decide whether to use composing characters
-        for s in self.symbols[: len(counts)]:
-            if s in COMPOSING_SYMBOLS:
-                self.compose = " "
-                break
-        else:
-            self.compose = None
+        heights : iterable
+            The height in characters for each histogram in the bin, see
+            `bin_heights`
 
-        # Format bin
-        bin_string = ""
-        for i_line in range(width):
-            # Print axis
-            if self.print_top_edge and i_line == 0:
-                bin_string += self.tick(top)
-            elif not self.print_top_edge and i_line == (width - 1):
-                bin_string += self.tick(bottom)
-            else:
-                bin_string += self.no_tick()
-
-            # Print symbols
-            line = []
-            for h, s, fg, bg in zip(
-                heights,
-                cycle(self.symbols),
-                cycle(self.fg_colors),
-                cycle(self.bg_colors),
-            ):
-                if h:
-                    if self.stack:
-                        # Just print them all afer one another
-                        line += [
-                            Hixel(s, fg, bg, self.use_color, self.compose)
-                            for _ in range(h)
-                        ]
-                    # Overlay histograms
-                    elif h > len(line):
-                        for hix in line:
-                            hix.add(s, fg, bg)
-                        line += [
-                            Hixel(s, fg, bg, self.use_color, self.compose)
-                            for _ in range(h - len(line))
-                        ]
-                    else:
-                        for hix in line[:h]:
-                            hix.add(s, fg, bg)
-
-            for hix in line:
-                bin_string += hix.render()
-
-            # New line
-            bin_string += "\n"
-
-        return bin_string
+        """
+
+        if len(self.styles) != len(heights):
+            self.set_styles(len(heights))
+
+        if self.stack:
+            runs = [(cell, h) for cell, h in zip(self._stack_cells, heights) if h > 0]
+        else:
+            runs = self._overlay_cell_runs(heights)
+        return _render_line(runs, self.use_color)
+
+    def format_lines(self, tick, no_tick, line, width=1):
+        """Return the lines of a bin, see `format_bin` and `bin_line`."""
+
+        if width < 1:
+            return ""
+
+        # All lines of a bin show the same symbols,
+        # only one of them has a tick
+        tick_line = tick + line + "\n"
+        other_lines = (no_tick + line + "\n") * (width - 1)
+        if self.print_top_edge:
+            return tick_line + other_lines
+        return other_lines + tick_line
+
+    def _overlay_runs(self, heights):
+        """Yield the histograms covering each run of cells and its length."""
+
+        # Cells between two consecutive heights are covered by the same
+        # histograms, so they all end up in the same state.
+        # Negative bin contents draw nothing.
+        active = [(h, i) for i, h in enumerate(heights) if h > 0]
+        start = 0
+        for end in sorted({h for h, _ in active}):
+            yield tuple(i for h, i in active if h >= end), end - start
+            start = end
+
+    def _overlay_state(self, covering):
+        """Return the state of a cell covered by the given histograms."""
+
+        # State of a fresh Hixel with the first symbol
+        s, fg, bg = self.styles[covering[0]]
+        state = _add_symbol((" ", self.compose, fg, bg), s, fg, bg)
+        for i in covering[1:]:
+            s, fg, bg = self.styles[i]
+            state = _add_symbol(state, s, fg, bg)
+        return state
+
+    def _overlay_cell_runs(self, heights):
+        """Return the drawn cells of overlaid histograms, see `_render_line`."""
+
+        cells = self._overlay_cells
+        runs = []
+        for covering, n in self._overlay_runs(heights):
+            cell = cells.get(covering)
+            if cell is None:
+                cell = _hixel_glyph(*self._overlay_state(covering))
+                cells[covering] = cell
+            runs.append((cell, n))
+        return runs
 
     def tick(self, edge):
         """Format the tick mark of a bin."""
         return self.tick_format.format(edge) + self.tick_mark
 
+    def ticks(self, edges):
+        """Format the tick marks of several bins, see `tick`."""
+        fmt = self.tick_format.format
+        mark = self.tick_mark
+        return [fmt(e) + mark for e in np.asarray(edges).tolist()]
+
     def no_tick(self):
         """Format the axis without a tick mark."""
         return " " * self.tick_format_width + self.no_tick_mark
@@ -396,6 +547,7 @@ class HistFormatter:
             # Make room for a legend at the bottom
             self.hist_lines -= 1
 
+        bin_widths = np.diff(edges)
         if scale_bin_width:
             # Try to scale bins so the number of lines is
             # roughly proportional to the bin width
@@ -406,11 +558,12 @@ class HistFormatter:
             # Choose the largest bin as scale,
             # so all bins will scale to <= 1 lines
             # and be rendered with one line
-            line_scale = np.max(edges[1:] - edges[:-1])
+            line_scale = np.max(bin_widths)
         if line_scale == 0.0:
             line_scale = 1.0
-        self.bin_lines = ((edges[1:] - edges[:-1]) // line_scale).astype(int)
-        self.bin_lines = np.where(self.bin_lines, self.bin_lines, 1)
+        self.bin_lines = (bin_widths // line_scale).astype(np.intp)
+        # Every bin gets at least one line
+        np.maximum(self.bin_lines, 1, out=self.bin_lines)
         self.bin_formatter = BinFormatter(**kwargs)
 
     def format_histogram(self, counts):
@@ -424,15 +577,35 @@ class HistFormatter:
 
         """
 
+        return "".join(self.iter_histogram(counts))
+
+    def iter_histogram(self, counts):
+        """Format (a set of) histogram counts piece by piece.
+
+        Returns an iterator over the text of the header, every bin and the
+        summary, so they can be written out before the whole plot is done.
+        All checks are done before it is returned, so nothing needs to be
+        written if the histogram cannot be formatted.
+
+        Paramters
+        ---------
+
+        counts : ndarray
+            The histogram entries to be plotted.
+
+        """
+
         axis_width = self.bin_formatter.tick_format_width + len(
             self.bin_formatter.tick_mark
         )
         hist_width = self.columns - axis_width
 
-        counts = np.nan_to_num(np.array(counts))
-        while counts.ndim < 2:
-            # Make sure counts is a 2D array
-            counts = counts[np.newaxis, ...]
+        # Only copy the counts if there are non-finite values to replace
+        counts = np.asarray(counts)
+        if counts.dtype.kind in "fc" and not np.isfinite(counts).all():
+            counts = np.nan_to_num(counts)
+        # Make sure counts is a 2D array
+        counts = np.atleast_2d(counts)
 
         # Get max or total counts in each bin
         if self.bin_formatter.stack:
@@ -452,52 +625,68 @@ class HistFormatter:
         symbol_scale = max_c / hist_width
         self.bin_formatter.scale = symbol_scale * 0.999  # <- avoid rounding issues
 
-        hist_string = ""
-
-        # Write the title line
-        if len(self.title):
-            hist_string += f"{self.title: ^{self.columns:d}s}\n"
-
         # Get bin edges
-        top = np.array(self.edges[:-1])
-        bottom = np.array(self.edges[1:])
-        # Caclucate common exponent
-        common_exponent = np.floor(np.log10(np.max(np.abs(self.edges))))
-        top /= 10**common_exponent
-        bottom /= 10**common_exponent
-
-        # Write the first tick, common exponent and horizontal axis
-        hist_string += self.bin_formatter.tick(top[0])
+        top = np.asarray(self.edges[:-1])
+        bottom = np.asarray(self.edges[1:])
+        # Caclucate common exponent,
+        # the edges are monotonic so the largest magnitude is at one end
+        max_edge = max(abs(self.edges[0]), abs(self.edges[-1]))
+        common_exponent = np.floor(np.log10(max_edge))
+        if common_exponent != 0:
+            top = top / 10**common_exponent
+            bottom = bottom / 10**common_exponent
+
+        # Title line, first tick, common exponent and horizontal axis
+        header = []
+        if len(self.title):
+            header.append(f"{self.title: ^{self.columns:d}s}\n")
+        header.append(self.bin_formatter.tick(top[0]))
         ce_string = f" x 10^{common_exponent:+03.0f}" if common_exponent != 0 else ""
-
-        hist_string += ce_string
+        header.append(ce_string)
         if self.bin_formatter.count_area:
             longest_count = f"{max_c:g}/row"
         else:
             longest_count = f"{max_c:g}"
-        hist_string += f"{longest_count:>{hist_width - len(ce_string) - 2:d}s} \u2577\n"
+        header.append(f"{longest_count:>{hist_width - len(ce_string) - 2:d}s} \u2577\n")
+
+        # Calculate all bin heights at once
+        heights = self.bin_formatter.bin_heights(counts, self.bin_lines)
+        self.bin_formatter.set_styles(len(counts))
+
+        # Format the ticks once for all bins
+        tick_edges = top if self.bin_formatter.print_top_edge else bottom
+        ticks = self.bin_formatter.ticks(tick_edges)
+        no_tick = self.bin_formatter.no_tick()
 
-        # Write the bins
-        for c, t, b, w in zip(counts.T, top, bottom, self.bin_lines):
-            hist_string += self.bin_formatter.format_bin(t, b, c, w)
+        # Bins with the same heights look the same,
+        # so only render each distinct line once
+        rows, inverse = np.unique(heights.T, axis=0, return_inverse=True)
+        lines = [self.bin_formatter.bin_line(r) for r in rows]
 
         if self.summary:
-            hist_string += self.summarize(counts, top, bottom)
+            footer = [self.summarize(counts, top, bottom)]
         elif any(len(lab) > 0 for lab in self.labels):
-            hist_string += self.summarize(counts, top, bottom, legend_only=True)
+            footer = [self.summarize(counts, top, bottom, legend_only=True)]
+        else:
+            footer = []
 
-        return hist_string
+        # Everything that can fail has been done above,
+        # only the joining of the bins is left to the caller
+        bins = (
+            self.bin_formatter.format_lines(t, no_tick, lines[i], w)
+            for i, t, w in zip(inverse.ravel(), ticks, self.bin_lines)
+        )
+        return chain(header, bins, footer)
 
     def summarize(self, counts, top, bottom, legend_only=False):
         """Calculate some summary statistics."""
 
-        summary = ""
         bin_values = (top + bottom) / 2
 
         label_widths = []
 
         # First line: symbol, label
-        summary += "     "
+        labels = ["     "]
         for _, lab, s, fg, bg in zip(
             counts,
             cycle(self.labels),
@@ -513,43 +702,40 @@ class HistFormatter:
             ).render()
             label += " " + pad_lab
             label_widths.append(3 + len(pad_lab))
-            summary += label
+            labels.append(label)
         pad = max(self.columns - (5 + np.sum(label_widths)), 0) // 2
-        summary = " " * pad + summary
-        summary += "\n"
+        summary = [" " * pad, *labels, "\n"]
 
         if legend_only:
-            return summary
+            return "".join(summary)
+
+        # Calculate the statistics of all histograms at once
+        totals = np.sum(counts, axis=1)
+        # Empty histograms have undefined averages and widths
+        norm = np.where(totals != 0, totals, np.nan)
+        averages = np.sum(counts * bin_values, axis=1) / norm
+        deviations = (bin_values - averages[:, np.newaxis]) ** 2
+        stds = np.sqrt(np.sum(counts * deviations, axis=1) / norm)
 
         # Second line: Total
-        summary += " " * pad + "Tot:"
-        for c, w in zip(counts, label_widths):
-            tot = float(np.sum(c))
-            summary += f" {tot: .2e}" + " " * (w - 10)
-        summary += "\n"
+        summary.append(" " * pad + "Tot:")
+        for tot, w in zip(totals, label_widths):
+            summary.append(f" {float(tot): .2e}" + " " * (w - 10))
+        summary.append("\n")
 
         # Third line: Average
-        summary += " " * pad + "Avg:"
-        for c, w in zip(counts, label_widths):
-            try:
-                average = float(np.average(bin_values, weights=c))
-            except ZeroDivisionError:
-                average = np.nan
-            summary += f" {average: .2e}" + " " * (w - 10)
-        summary += "\n"
+        summary.append(" " * pad + "Avg:")
+        for average, w in zip(averages, label_widths):
+            summary.append(f" {float(average): .2e}" + " " * (w - 10))
+        summary.append("\n")
 
         # Fourth line: std
-        summary += " " * pad + "Std:"
-        for c, w in zip(counts, label_widths):
-            try:
-                average = float(np.average(bin_values, weights=c))
-                std = np.sqrt(np.average((bin_values - average) ** 2, weights=c))
-            except ZeroDivisionError:
-                std = np.nan
-            summary += f" {std: .2e}" + " " * (w - 10)
-        summary += "\n"
+        summary.append(" " * pad + "Std:")
+        for std, w in zip(stds, label_widths):
+            summary.append(f" {float(std): .2e}" + " " * (w - 10))
+        summary.append("\n")
 
-        return summary
+        return "".join(summary)
 
 
 def get_plottable_protocol_bin_edges(axis):
@@ -579,7 +765,13 @@ def get_count_edges(hist):
         for other_edges in (
             get_plottable_protocol_bin_edges(h.axes[0]) for h in hist[1:]
         ):
-            np.testing.assert_allclose(edges, other_edges)
+            # Same tolerance as `np.testing.assert_allclose`,
+            # without importing the testing framework
+            if other_edges.shape != edges.shape or not np.allclose(
+                edges, other_edges, rtol=1e-7, atol=0
+            ):
+                msg = "All histograms must have the same bin edges."
+                raise ValueError(msg)
 
     else:
         # Single histogram or (a,b,c, edges) tuple:
@@ -608,11 +800,95 @@ def print_hist(hist, file=None, **kwargs):
     if file is None:
         file = sys.stdout
     count, edges = get_count_edges(hist)
-    hist_formatter = HistFormatter(edges, **kwargs)
-    file.write(hist_formatter.format_histogram(count))
+    for part in _iter_hist(count, edges, **kwargs):
+        file.write(part)
     file.flush()
 
 
+def format_hist(hist, **kwargs):
+    """Format a compatible histogram as a string, see `print_hist`.
+
+    Parameters
+    ----------
+
+    **kwargs :
+        Additional keyword arguments are passed to the `HistFormatter`.
+
+    """
+    count, edges = get_count_edges(hist)
+    return "".join(_iter_hist(count, edges, **kwargs))
+
+
+# Taller plots are written out piece by piece instead of being cached
+_MAX_CACHED_LINES = 1000
+# Histograms with more values are not cached, to bound the cache's memory
+_MAX_CACHED_COUNTS = 10000
+
+
+def _iter_hist(count, edges, **kwargs):
+    """Format histogram counts and edges as an iterable of strings.
+
+    Identical calls return the cached output of the previous one, unless
+    the histogram is too big. Uncached and very tall plots are formatted
+    piece by piece.
+
+    Parameters
+    ----------
+
+    count : ndarray
+        The histogram entries to be plotted.
+    edges : ndarray
+        The bin edges of the histogram.
+    **kwargs :
+        Additional keyword arguments are passed to the `HistFormatter`.
+
+    """
+
+    count = np.asarray(count)
+    edges = np.asarray(edges)
+    try:
+        config = tuple(
+            sorted(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in kwargs.items()
+            )
+        )
+        # The terminal size determines the default size of the output
+        config += (("terminal_size", tuple(shutil.get_terminal_size())),)
+        hash(config)
+    except TypeError:
+        # Not all arguments are hashable
+        config = None
+    # Every bin gets at least one line
+    height = max(len(edges) - 1, kwargs.get("lines") or 0)
+    if (
+        config is None
+        or count.dtype.kind not in "biuf"
+        or count.size + edges.size > _MAX_CACHED_COUNTS
+        or height > _MAX_CACHED_LINES
+    ):
+        return HistFormatter(edges, **kwargs).iter_histogram(count)
+
+    return (_format_cached(_array_key(count), _array_key(edges), config),)
+
+
+def _array_key(array):
+    """Turn a NumPy array into a hashable key."""
+    return array.tobytes(), array.dtype.str, array.shape
+
+
+@functools.lru_cache(maxsize=32)
+def _format_cached(count_key, edges_key, config):
+    """Format a histogram given as hashable keys, see `_iter_hist`."""
+
+    count, edges = (
+        np.frombuffer(data, dtype=dtype).reshape(shape)
+        for data, dtype, shape in (count_key, edges_key)
+    )
+    kwargs = {key: value for key, value in config if key != "terminal_size"}
+    return HistFormatter(edges, **kwargs).format_histogram(count)
+
+
 def text_hist(*args, density=None, **kwargs):
     """Thin wrapper around ``numpy.histogram``."""
 
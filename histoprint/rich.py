@@ -30,10 +30,9 @@ class RichHistogram:
     def __rich__(self):
         """Output rich formatted histogram."""
 
-        count, edges = formatter.get_count_edges(self.hist)
-        hist_formatter = formatter.HistFormatter(edges, **self.kwargs)
-
-        text = Text.from_ansi(hist_formatter.format_histogram(count))
+        # Live displays re-render unchanged histograms many times,
+        # so go through the output cache of `format_hist`
+        text = Text.from_ansi(formatter.format_hist(self.hist, **self.kwargs))
 
         # Make sure lines are never wrapped or right-justified
         text.justify = "left"
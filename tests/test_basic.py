@@ -1,11 +1,14 @@
 import contextlib
 import io
+import os
+import sys
 
 import numpy as np
 import pytest
 from uhi.numpy_plottable import ensure_plottable_histogram
 
 import histoprint as hp
+from histoprint import cli, formatter
 
 
 def test_hist():
@@ -63,7 +66,7 @@ def test_width():
     for line in f:
         print(line, end="")
         n = len(line.rstrip())
-        n_max = np.max((n, n_max))
+        n_max = max(n, n_max)
     assert n_max == 30
 
     hist = (np.array((100.5, 17.5)), np.array((0, 1, 2)))
@@ -75,7 +78,7 @@ def test_width():
     for line in f:
         print(line, end="")
         n = len(line.rstrip())
-        n_max = np.max((n, n_max))
+        n_max = max(n, n_max)
     assert n_max == 30
 
 
@@ -180,3 +183,120 @@ def test_rich_histogram():
     tab.add_row(hist, Align.center(hist), Align.right(hist))
 
     rich.print(tab)
+
+
+def test_format_bin():
+    """Test formatting a single bin."""
+
+    bin_formatter = formatter.BinFormatter(use_color=False, symbols="|=")
+    assert bin_formatter.format_bin(0.0, 1.0, [3, 1]) == "  1.000 _\u256a\u2502\u2502\n"
+
+
+def test_negative_counts():
+    """Test that negative bin contents draw nothing in overlays."""
+
+    hist = (np.array([[-30, 20], [10, -5]]), np.array([0.0, 1.0, 2.0]))
+    f = io.StringIO()
+    hp.print_hist(hist, file=f, columns=40, lines=6, use_color=False)
+    lines = f.getvalue().splitlines()
+    assert max(len(line) for line in lines) <= 40
+    # The first bin only shows the 10 entries of the second histogram
+    assert lines[2].count("\u2502") == 15
+
+
+def test_output_cache(monkeypatch):
+    """Test that reused output follows changes of the inputs."""
+
+    hist = np.histogram(np.random.randn(1000), bins=20)
+
+    def output(**kwargs):
+        f = io.StringIO()
+        hp.print_hist(hist, file=f, labels=["A"], **kwargs)
+        return f.getvalue()
+
+    monkeypatch.setattr(
+        formatter.shutil, "get_terminal_size", lambda: os.terminal_size((60, 24))
+    )
+    first = output()
+    assert output() == first
+
+    # Other options or terminal sizes change the output
+    assert output(columns=50) != first
+    monkeypatch.setattr(
+        formatter.shutil, "get_terminal_size", lambda: os.terminal_size((70, 24))
+    )
+    assert output() != first
+    monkeypatch.setattr(
+        formatter.shutil, "get_terminal_size", lambda: os.terminal_size((60, 24))
+    )
+    assert output() == first
+
+    # So do counts that are changed in place
+    hist[0][0] += 100
+    assert output() != first
+
+
+def test_slices():
+    """Test parsing slices of ROOT branches without `eval`."""
+
+    array = np.arange(24).reshape(4, 6)
+    for slices, expected in [
+        ("", array),
+        ("[:,0]", array[:, 0]),
+        ("[1:][0]", array[1:][0]),
+        ("[..., -1]", array[..., -1]),
+        ("[::-1]", array[::-1]),
+        ("[None]", array[None]),
+    ]:
+        np.testing.assert_array_equal(cli._apply_slices(array, slices), expected)
+
+    for slices in ["[__import__('os')]", "[[0,1]]", "[0.5]", "[:,", "[0](1)", ".T"]:
+        with pytest.raises(ValueError, match=r"integers|interpret"):
+            cli._apply_slices(array, slices)
+
+
+def test_whitespace_table_without_pandas(monkeypatch, tmp_path):
+    """Test reading text tables in chunks with NumPy alone."""
+
+    path = tmp_path / "table.txt"
+    path.write_text("# x y\n" + "".join(f"{i} {2 * i}\n" for i in range(10)))
+    monkeypatch.setitem(sys.modules, "pandas", None)
+
+    chunks = list(cli._read_whitespace_table(str(path), chunksize=4))
+    assert [len(chunk) for chunk in chunks] == [3, 4, 3]
+    np.testing.assert_array_equal(np.concatenate(chunks), np.loadtxt(path))
+
+    source = io.BytesIO(path.read_bytes())
+    chunks = list(cli._read_whitespace_table(source, chunksize=4))
+    np.testing.assert_array_equal(np.concatenate(chunks), np.loadtxt(path))
+    assert not source.closed
+
+
+def test_streaming():
+    """Test writing tall histograms piece by piece."""
+
+    hist = np.histogram(np.random.randn(1000), bins=20)
+    hist_formatter = formatter.HistFormatter(hist[1], columns=50, lines=2000)
+    parts = list(hist_formatter.iter_histogram(hist[0]))
+
+    assert len(parts) > 1
+    assert "".join(parts) == hist_formatter.format_histogram(hist[0])
+
+    out = io.StringIO()
+    hp.print_hist(hist, file=out, columns=50, lines=2000)
+    assert out.getvalue() == "".join(parts)
+
+    # Plots with many bins are tall even without setting the lines
+    hist = np.histogram(np.random.randn(1000), bins=2000)
+    parts = formatter._iter_hist(*hist, columns=50)
+    assert not isinstance(parts, tuple)
+
+
+def test_print_hist_error():
+    """Test that nothing is written if a histogram cannot be printed."""
+
+    hist = np.histogram(np.random.randn(1000), bins=20000)
+    f = io.StringIO()
+    with pytest.raises(ValueError, match="Symbol"):
+        hp.print_hist(hist, file=f, symbols="X", title="T")
+    assert f.getvalue() == ""